@@ -1,4 +1,4 @@
-import requests
+import httpx
 import json
 import logging
 import os
@@ -11,7 +11,8 @@ class PandemicAPIClient:
         if base_url is None:
             base_url = os.getenv('API_BASE_URL', 'http://localhost:8000')
         self.base_url = base_url
-        self.session = requests.Session()
+        # Pooled keep-alive connections (HTTP/2 where the server negotiates it)
+        self.session = httpx.Client(http2=True, timeout=5.0)
         
     def create_simulation(self, parameters: Dict[str, Any]) -> Optional[str]:
         """Create a new simulation with given parameters"""
@@ -22,7 +23,7 @@ class PandemicAPIClient:
             
             data = response.json()
             return data.get('id')
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error creating simulation: {e}")
             return None
     
@@ -35,7 +36,7 @@ class PandemicAPIClient:
             
             data = response.json()
             return data.get('task_id')
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error running simulation: {e}")
             return None
     
@@ -46,7 +47,7 @@ class PandemicAPIClient:
             response = self.session.get(url)
             response.raise_for_status()
             return True
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error stopping simulation: {e}")
             return False
     
@@ -58,10 +59,13 @@ class PandemicAPIClient:
             response.raise_for_status()
             
             return response.json()
-        except requests.RequestException as e:
-            if response.status_code != 404:  # 404 is expected when data not ready
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:  # 404 is expected when data not ready
                 logger.error(f"Error getting simulation output for day {day}: {e}")
             return None
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting simulation output for day {day}: {e}")
+            return None
     
     def reset_state(self) -> bool:
         """Reset the simulation state"""
@@ -70,7 +74,7 @@ class PandemicAPIClient:
             response = self.session.get(url)
             response.raise_for_status()
             return True
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error resetting state: {e}")
             return False
     
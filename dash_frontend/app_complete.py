@@ -1,8 +1,10 @@
 import dash
-from dash import dcc, html, Input, Output, State, callback, ctx, ALL, dash_table
+from dash import dcc, html, Input, Output, State, callback, ctx, ALL, dash_table, Patch
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from asgiref.wsgi import WsgiToAsgi
+from flask_compress import Compress
 import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
 import json
 import requests
@@ -19,6 +21,10 @@ app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "epiENGAGE - Interactive Outbreak Simulator"
 app.config.suppress_callback_exceptions = True
 
+# Compress callback responses (Brotli, falling back to gzip)
+app.server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app.server)
+
 # API Configuration
 API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:8000')
 
@@ -58,6 +64,9 @@ AGE_GROUPS = [
     {'value': '65+ years', 'label': '65+ years'}
 ]
 
+# Case fatality rate fallback, one per age group
+DEFAULT_NU = (0.0,) * len(AGE_GROUPS)
+
 AGE_GROUP_MAPPING = {
     '0-4 years': '0',
     '5-24 years': '1', 
@@ -118,6 +127,41 @@ PRESET_SCENARIOS = {
     }
 }
 
+# Shared inline styles - reused by identity instead of re-created per render
+MUTED_TEXT_STYLE = {'color': '#6c757d', 'fontStyle': 'italic'}
+SECTION_HEADING_STYLE = {'fontWeight': 'bold', 'marginBottom': '10px'}
+INDENTED_LIST_STYLE = {'marginLeft': '20px'}
+INDENTED_LIST_SPACED_STYLE = {'marginLeft': '20px', 'marginBottom': '15px'}
+
+# SEATIRD compartments plotted on the epidemic curve: (name, event key, color)
+SEATIRD_COMPARTMENTS = [
+    ('Susceptible', 'totalSusceptible', 'blue'),
+    ('Exposed', 'totalExposed', 'orange'),
+    ('Asymptomatic', 'totalAsymptomaticCount', 'yellow'),
+    ('Treatable', 'totalTreatableCount', 'purple'),
+    ('Infected', 'totalInfectedCount', 'red'),
+    ('Recovered', 'totalRecoveredCount', 'green'),
+    ('Deceased', 'totalDeceased', 'black')
+]
+
+# Static figures - built once, callbacks only patch their data.
+# Plain dicts skip plotly's property validation; dcc.Graph accepts either form.
+MAP_LAYOUT = {
+    'title': "Texas Counties - Interactive Pandemic Simulation",
+    'geo': {'scope': 'usa', 'projection': {'type': 'albers usa'}},
+    'height': 400
+}
+
+CHART_LAYOUT = {
+    'title': "Epidemic Curve - SEATIRD Model",
+    'xaxis': {'title': "Day"},
+    'yaxis': {'title': "Population Count"},
+    'height': 300
+}
+
+MAP_FIGURE = {'data': [], 'layout': MAP_LAYOUT}
+CHART_FIGURE = {'data': [], 'layout': CHART_LAYOUT}
+
 # App Layout - Exact match to React structure
 app.layout = html.Div([
     # Stores for state management (like React useState)
@@ -130,6 +174,7 @@ app.layout = html.Div([
     dcc.Store(id='antiviral-data', data={}),
     dcc.Store(id='vaccine-data', data={}),
     dcc.Store(id='displayed-tab', data='scenario'),
+    dcc.Store(id='ui-state', data=None),
     dcc.Interval(id='simulation-interval', interval=1000, disabled=True),
     
     # Header - Exact match to React Header component
@@ -260,7 +305,7 @@ def create_home_layout():
                         
                         # Tab content
                         html.Div(id='displayed-parameters-content', children=[
-                            html.P('No scenario set yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
+                            html.P('No scenario set yet.', style=MUTED_TEXT_STYLE)
                         ])
                     ], className='displayed-parameters-panel')
                 ], className='left-panel')
@@ -288,6 +333,7 @@ def create_home_layout():
                     # Map
                     dcc.Graph(
                         id='spread-map',
+                        figure=MAP_FIGURE,
                         style={'height': '400px', 'marginBottom': '10px'},
                         config={'displayModeBar': False}
                     ),
@@ -295,6 +341,7 @@ def create_home_layout():
                     # Line Chart
                     dcc.Graph(
                         id='line-chart',
+                        figure=CHART_FIGURE,
                         style={'height': '300px'},
                         config={'displayModeBar': False}
                     )
@@ -305,7 +352,7 @@ def create_home_layout():
             html.Div([
                 html.Div([
                     html.H6('County Data', style={'marginBottom': '15px'}),
-                    html.Div(id='spread-table')
+                    html.Div(id='spread-table', children=html.P('No data available', style=MUTED_TEXT_STYLE))
                 ], className='right-panel')
             ], className='col-lg-3'),
             
@@ -520,7 +567,7 @@ app.layout.children.extend([disease_params_modal, initial_cases_modal])
     prevent_initial_call=True
 )
 def navigate_pages(home_clicks, userguide_clicks):
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else 'nav-home'
+    triggered_id = ctx.triggered_id or 'nav-home'
     
     if triggered_id == 'nav-userguide':
         return create_userguide_layout(), 'tab-button', 'tab-button active'
@@ -629,9 +676,9 @@ def load_preset_scenario(preset_key):
     prevent_initial_call=True
 )
 def manage_initial_cases(add_clicks, remove_clicks, location, cases_count, age_group, current_data):
-    triggered_id = ctx.triggered[0]['prop_id'] if ctx.triggered else None
+    triggered_id = ctx.triggered_id
     
-    if 'add-initial-case-btn' in triggered_id and location and cases_count:
+    if triggered_id == 'add-initial-case-btn' and location and cases_count:
         # Add new case
         fips_id = texas_mapping.get(location, '0')
         age_group_id = AGE_GROUP_MAPPING.get(age_group, '0')
@@ -646,13 +693,10 @@ def manage_initial_cases(add_clicks, remove_clicks, location, cases_count, age_g
         }
         current_data.append(new_case)
     
-    elif 'remove-case-btn' in triggered_id:
+    elif isinstance(triggered_id, dict) and triggered_id.get('type') == 'remove-case-btn':
         # Remove case by index
-        import re
-        match = re.search(r'"index":(\d+)', triggered_id)
-        if match:
-            remove_index = int(match.group(1))
-            current_data = [case for case in current_data if case['id'] != remove_index]
+        remove_index = triggered_id['index']
+        current_data = [case for case in current_data if case['id'] != remove_index]
     
     # Create table
     if current_data:
@@ -681,7 +725,7 @@ def manage_initial_cases(add_clicks, remove_clicks, location, cases_count, age_g
             html.Tbody(table_rows)
         ], className='table table-striped')
     else:
-        table = html.P('No initial cases added yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
+        table = html.P('No initial cases added yet.', style=MUTED_TEXT_STYLE)
     
     return current_data, table
 
@@ -725,7 +769,7 @@ def save_disease_parameters(n_clicks, scenario_name, r0, tau, kappa, gamma,
         if displayed_tab == 'scenario':
             content = create_scenario_display(disease_params, initial_cases)
         else:
-            content = html.P('No interventions set yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
+            content = html.P('No interventions set yet.', style=MUTED_TEXT_STYLE)
         
         # Enable play button if we have both parameters and initial cases
         play_disabled = not (disease_params and initial_cases)
@@ -734,118 +778,187 @@ def save_disease_parameters(n_clicks, scenario_name, r0, tau, kappa, gamma,
     
     return dash.no_update, dash.no_update, dash.no_update
 
-# Tab switching callback
+# Tab switching callback - one snapshot output, fanned out clientside
 @callback(
-    [Output('displayed-parameters-content', 'children', allow_duplicate=True),
-     Output('scenario-tab-btn', 'className'),
-     Output('interventions-tab-btn', 'className'),
-     Output('displayed-tab', 'data')],
+    Output('ui-state', 'data'),
     [Input('scenario-tab-btn', 'n_clicks'),
      Input('interventions-tab-btn', 'n_clicks')],
-    [State('disease-parameters', 'data'),
+    [State('displayed-tab', 'data'),
+     State('disease-parameters', 'data'),
      State('initial-cases-data', 'data'),
      State('npi-data', 'data'),
      State('antiviral-data', 'data'),
      State('vaccine-data', 'data')],
     prevent_initial_call=True
 )
-def switch_displayed_tab(scenario_clicks, interventions_clicks, disease_params, initial_cases, 
-                        npi_data, antiviral_data, vaccine_data):
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else 'scenario-tab-btn'
+def switch_displayed_tab(scenario_clicks, interventions_clicks, displayed_tab, disease_params, 
+                        initial_cases, npi_data, antiviral_data, vaccine_data):
+    triggered_id = ctx.triggered_id if ctx.triggered_id in _TAB_HANDLERS else 'scenario-tab-btn'
+    build_content, tab_state = _TAB_HANDLERS[triggered_id]
+    
+    # Clicking the already active tab changes nothing
+    if tab_state['active'] == displayed_tab:
+        raise PreventUpdate
     
-    if triggered_id == 'interventions-tab-btn':
-        content = create_interventions_display(npi_data, antiviral_data, vaccine_data)
-        return content, 'tab-btn', 'tab-btn active-tab', 'interventions'
+    # Switching back to a tab with unchanged stores reuses its last render
+    payload = (disease_params, initial_cases, npi_data, antiviral_data, vaccine_data)
+    cached = _last_tab_render.get(triggered_id)
+    if cached is not None and cached[0] == payload:
+        content = cached[1]
     else:
-        content = create_scenario_display(disease_params, initial_cases)
-        return content, 'tab-btn active-tab', 'tab-btn', 'scenario'
+        content = build_content(*payload)
+        _last_tab_render[triggered_id] = (payload, content)
+    
+    return {'content': content, **tab_state}
+
+app.clientside_callback(
+    """
+    function(uiState) {
+        if (!uiState) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        return [uiState.content, uiState.scenario_class, uiState.interv_class, uiState.active];
+    }
+    """,
+    [Output('displayed-parameters-content', 'children', allow_duplicate=True),
+     Output('scenario-tab-btn', 'className'),
+     Output('interventions-tab-btn', 'className'),
+     Output('displayed-tab', 'data')],
+    Input('ui-state', 'data'),
+    prevent_initial_call=True
+)
+
+def _build_scenario_tab(disease_params, initial_cases, npi_data, antiviral_data, vaccine_data):
+    return create_scenario_display(disease_params, initial_cases)
+
+def _build_interventions_tab(disease_params, initial_cases, npi_data, antiviral_data, vaccine_data):
+    return create_interventions_display(npi_data, antiviral_data, vaccine_data)
+
+# Triggering button -> (content builder, tab button state)
+_TAB_HANDLERS = {
+    'scenario-tab-btn': (_build_scenario_tab, {
+        'scenario_class': 'tab-btn active-tab',
+        'interv_class': 'tab-btn',
+        'active': 'scenario'
+    }),
+    'interventions-tab-btn': (_build_interventions_tab, {
+        'scenario_class': 'tab-btn',
+        'interv_class': 'tab-btn active-tab',
+        'active': 'interventions'
+    })
+}
+
+# Last rendered content per tab: triggered id -> (store payload, content), replaced as one tuple
+_last_tab_render = {}
 
 def create_scenario_display(disease_params, initial_cases):
     """Create scenario tab display content"""
-    if not disease_params and not initial_cases:
-        return html.P('No scenario set yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
-    
-    content = []
-    
-    # Disease parameters section
-    if disease_params:
-        content.extend([
-            html.H6('Disease Parameters', style={'fontWeight': 'bold', 'marginBottom': '10px'}),
-            html.P(f"Scenario: {disease_params.get('scenario_name', 'Custom')}"),
-            html.P(f"Reproduction Number: {disease_params.get('R0', 0)}"),
-            html.P(f"Latency Period: {disease_params.get('tau', 0)} days"),
-            html.P(f"Asymptomatic Period: {disease_params.get('kappa', 0)} days"),
-            html.P(f"Symptomatic Period: {disease_params.get('gamma', 0)} days"),
-            html.P('Case Fatality Rate:'),
-            html.Ul([
-                html.Li(f"0-4: {disease_params.get('nu', [0,0,0,0,0])[0]:.9f}"),
-                html.Li(f"5-24: {disease_params.get('nu', [0,0,0,0,0])[1]:.9f}"),
-                html.Li(f"25-49: {disease_params.get('nu', [0,0,0,0,0])[2]:.9f}"),
-                html.Li(f"50-64: {disease_params.get('nu', [0,0,0,0,0])[3]:.9f}"),
-                html.Li(f"65+: {disease_params.get('nu', [0,0,0,0,0])[4]:.9f}")
-            ], style={'marginLeft': '20px', 'marginBottom': '15px'})
-        ])
-    
-    # Initial cases section
-    if initial_cases:
-        content.extend([
-            html.H6('Initial Cases', style={'fontWeight': 'bold', 'marginBottom': '10px'}),
-            html.Ul([
-                html.Li(f"{case['cases']} aged {case['age_group']} in {case['location']}")
-                for case in initial_cases
-            ], style={'marginLeft': '20px'})
-        ])
-    
-    if not content:
-        return html.P('No scenario set yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
-    
-    return html.Div(content)
+    builder = _SCENARIO_BUILDERS[bool(disease_params) | (bool(initial_cases) << 1)]
+    return builder(disease_params, initial_cases)
 
-def create_interventions_display(npi_data, antiviral_data, vaccine_data):
-    """Create interventions tab display content"""
-    return html.P('No interventions set yet.', style={'color': '#6c757d', 'fontStyle': 'italic'})
+def _disease_params_section(disease_params):
+    nu = disease_params.get('nu', DEFAULT_NU)
+    return [
+        html.H6('Disease Parameters', style=SECTION_HEADING_STYLE),
+        html.P(f"Scenario: {disease_params.get('scenario_name', 'Custom')}"),
+        html.P(f"Reproduction Number: {disease_params.get('R0', 0)}"),
+        html.P(f"Latency Period: {disease_params.get('tau', 0)} days"),
+        html.P(f"Asymptomatic Period: {disease_params.get('kappa', 0)} days"),
+        html.P(f"Symptomatic Period: {disease_params.get('gamma', 0)} days"),
+        html.P('Case Fatality Rate:'),
+        html.Pre("\n".join([
+            f"0-4:    {nu[0]:.9f}",
+            f"5-24:   {nu[1]:.9f}",
+            f"25-49:  {nu[2]:.9f}",
+            f"50-64:  {nu[3]:.9f}",
+            f"65+:    {nu[4]:.9f}"
+        ]), style=INDENTED_LIST_SPACED_STYLE)
+    ]
 
-# Placeholder callbacks for remaining functionality
-@callback(
-    Output('spread-map', 'figure'),
-    [Input('event-data', 'data'),
-     Input('timeline-slider', 'value'),
-     Input('view-toggle', 'value')]
+def _initial_cases_section(initial_cases):
+    return [
+        html.H6('Initial Cases', style=SECTION_HEADING_STYLE),
+        html.Ul(list(map(_initial_case_item, initial_cases)), style=INDENTED_LIST_STYLE)
+    ]
+
+def _initial_case_item(case):
+    return html.Li(f"{case['cases']} aged {case['age_group']} in {case['location']}")
+
+def _build_scenario_none(disease_params, initial_cases):
+    return html.P('No scenario set yet.', style=MUTED_TEXT_STYLE)
+
+def _build_scenario_disease_only(disease_params, initial_cases):
+    return html.Div(_disease_params_section(disease_params))
+
+def _build_scenario_cases_only(disease_params, initial_cases):
+    return html.Div(_initial_cases_section(initial_cases))
+
+def _build_scenario_both(disease_params, initial_cases):
+    return html.Div(_disease_params_section(disease_params) + _initial_cases_section(initial_cases))
+
+# Indexed by bool(disease_params) | bool(initial_cases) << 1
+_SCENARIO_BUILDERS = (
+    _build_scenario_none,
+    _build_scenario_disease_only,
+    _build_scenario_cases_only,
+    _build_scenario_both
 )
-def update_map(event_data, timeline_value, view_type):
-    fig = go.Figure()
-    fig.update_layout(
-        title="Texas Counties - Interactive Pandemic Simulation",
-        geo=dict(scope='usa', projection=go.layout.geo.Projection(type='albers usa')),
-        height=400
-    )
-    return fig
 
+def create_interventions_display(npi_data, antiviral_data, vaccine_data):
+    """Create interventions tab display content"""
+    return html.P('No interventions set yet.', style=MUTED_TEXT_STYLE)
+
+# Placeholder callbacks for remaining functionality; the map keeps its static MAP_FIGURE
 @callback(
     Output('line-chart', 'figure'),
-    Input('event-data', 'data')
+    Input('event-data', 'data'),
+    prevent_initial_call=True
 )
 def update_chart(event_data):
-    fig = go.Figure()
-    fig.update_layout(
-        title="Epidemic Curve - SEATIRD Model",
-        xaxis_title="Day",
-        yaxis_title="Population Count",
-        height=300
-    )
-    return fig
+    if not event_data:
+        raise PreventUpdate
+    
+    # Layout is static (CHART_FIGURE); only the traces are sent
+    fig_patch = Patch()
+    fig_patch['data'] = create_chart_traces(event_data)
+    return fig_patch
+
+def create_chart_traces(event_data):
+    """Create epidemic curve traces (WebGL-rendered)"""
+    if not event_data:
+        return []
+    
+    days = [d['day'] for d in event_data]
+    return [
+        {
+            'type': 'scattergl',
+            'x': days,
+            'y': [d.get(key, 0) for d in event_data],
+            'name': name,
+            'mode': 'lines',
+            'line': {'color': color, 'width': 2}
+        }
+        for name, key, color in SEATIRD_COMPARTMENTS
+    ]
 
 @callback(
     Output('spread-table', 'children'),
     [Input('event-data', 'data'),
      Input('timeline-slider', 'value'),
-     Input('view-toggle', 'value')]
+     Input('view-toggle', 'value')],
+    prevent_initial_call=True
 )
 def update_table(event_data, timeline_value, view_type):
-    return html.P('No data available', style={'color': '#6c757d', 'fontStyle': 'italic'})
+    if not event_data:
+        raise PreventUpdate
+    return html.P('No data available', style=MUTED_TEXT_STYLE)
 
 # Expose server for deployment
 server = app.server
 
+# ASGI entry point for production, e.g.
+#   uvicorn app_complete:asgi_server --loop uvloop --http httptools --workers 4
+asgi_server = WsgiToAsgi(server)
+
 if __name__ == '__main__':
     app.run_server(debug=True, host='0.0.0.0', port=8051)
\ No newline at end of file
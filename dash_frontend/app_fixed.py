@@ -1,67 +1,81 @@
 import dash
-from dash import dcc, html, Input, Output, State, callback, ctx, ALL, dash_table
+from dash import dcc, html, Input, Output, State, callback, ctx, ALL, dash_table, ClientsideFunction, Patch
 import dash_bootstrap_components as dbc
-import plotly.express as px
+from dash.exceptions import PreventUpdate
+import diskcache
+from flask import Response, request, stream_with_context
 import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
 import json
-import requests
+import orjson
+import time
+import functools
 import logging
 from datetime import datetime
 import os
 
+from api_client import PandemicAPIClient
+from data_loader import DataLoader
+
+# Serialize callback responses (figures, tables, stores) with orjson
+pio.json.config.default_engine = 'orjson'
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Background callbacks run in separate processes so slow backend calls don't block workers
+background_callback_manager = dash.DiskcacheManager(diskcache.Cache('./cache'))
+
 # Initialize Dash app with external CSS
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP],
+                background_callback_manager=background_callback_manager)
 app.title = "epiENGAGE - Interactive Outbreak Simulator"
 app.config.suppress_callback_exceptions = True
 
 # API Configuration
 API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:8000')
 
-# Load Texas counties data exactly like React
-def load_texas_counties():
-    """Load Texas counties exactly like the React version"""
+api_client = PandemicAPIClient(API_BASE_URL)
+
+# County name to FIPS code mapping, the same file the React app uses
+TEXAS_MAPPING_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'texasMapping.json')
+
+@functools.lru_cache(maxsize=1)
+def load_texas_mapping():
+    """Load the county name to FIPS code mapping, keyed on casefolded names"""
+    # The dropdown asset and the mapping disagree on case (e.g. 'DeWitt' vs 'Dewitt')
     try:
-        # Read the JS file
-        with open('../frontend/src/data/texasCounties.js', 'r') as f:
-            content = f.read()
-        
-        # Extract the array content
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        counties_str = content[start:end]
-        
-        # Parse as JSON
-        counties_list = json.loads(counties_str)
-        
-        # Convert to the format used in React
-        return counties_list
+        with open(TEXAS_MAPPING_JSON, 'r') as f:
+            return {name.casefold(): fips for name, fips in json.load(f).items()}
     except Exception as e:
-        logger.warning(f"Could not load Texas counties: {e}")
-        # Use the same mock data as React would have
-        return [
-            'Anderson', 'Andrews', 'Angelina', 'Aransas', 'Archer', 'Armstrong',
-            'Atascosa', 'Austin', 'Bailey', 'Bandera', 'Bastrop', 'Baylor',
-            'Harris', 'Dallas', 'Tarrant', 'Bexar', 'Travis', 'Collin'
-        ]
+        logger.warning(f"Could not load Texas county mapping: {e}")
+        return {'harris': '201', 'dallas': '113'}
 
-# Load Texas counties
-texas_counties = load_texas_counties()
+# Age group seeded with the initial cases (0-4 years, app.py's default)
+INITIAL_CASES_AGE_GROUP = '0'
+
+# Simulation state before a run is created
+INITIAL_SIMULATION_STATE = {'isRunning': False, 'currentIndex': 0, 'taskId': None, 'id': None}
 
 # App Layout - Exact match to React structure
 app.layout = html.Div([
     # Stores for state management (like React useState)
-    dcc.Store(id='simulation-state', data={'isRunning': False, 'currentIndex': 0, 'taskId': None, 'id': None}),
+    dcc.Store(id='simulation-state', data=INITIAL_SIMULATION_STATE),
     dcc.Store(id='event-data', data=[]),
     dcc.Store(id='view-type', data='percent'),
     dcc.Store(id='last-sorted', data={'category': 'county', 'order': 'asc'}),
     dcc.Store(id='has-set-scenario', data=False),
     dcc.Store(id='has-set-cases', data=False),
-    dcc.Interval(id='simulation-interval', interval=1000, disabled=True),
+    dcc.Store(id='sim-stream-status', data='closed'),
+    # Bumped by assets/sse.js whenever streamed frames are queued for the line chart
+    dcc.Store(id='sim-stream-frames', data=0),
+    # Texas counties list, generated from texasCounties.js by scripts/build_counties_json.py
+    dcc.Store(id='counties-store', data=app.get_asset_url('texas_counties.json')),
+    # FIPS code to county name, for the county table
+    dcc.Store(id='county-names', data=DataLoader().get_fips_name_map()),
+    # simulation-interval is only mounted here while the simulation runs
+    html.Div(id='simulation-interval-container', children=[]),
     
     # Header - Exact match to React Header component
     html.Nav([
@@ -122,6 +136,34 @@ app.layout = html.Div([
     html.Div(id='main-content', style={'marginTop': '80px'})
 ])
 
+# Create visualizations - the figures never change, so build and serialize once per process
+@functools.lru_cache(maxsize=1)
+def create_empty_map():
+    fig = go.Figure()
+    fig.update_layout(
+        title="Texas Counties - No Data Available",
+        geo=dict(
+            scope='usa',
+            projection=go.layout.geo.Projection(type='albers usa'),
+            showlakes=True,
+            lakecolor='rgb(255, 255, 255)',
+        ),
+        height=400
+    )
+    return fig.to_plotly_json()
+
+@functools.lru_cache(maxsize=1)
+def create_empty_chart():
+    fig = go.Figure()
+    fig.update_layout(
+        title="Epidemic Curve - No Data Available",
+        xaxis_title="Day",
+        yaxis_title="Count",
+        dragmode='pan',
+        height=300
+    )
+    return fig.to_plotly_json()
+
 # Home page layout - Exact match to React Home component
 def create_home_layout():
     return html.Div([
@@ -278,6 +320,7 @@ def create_home_layout():
                     # Map
                     dcc.Graph(
                         id='spread-map',
+                        figure=create_empty_map(),
                         style={'height': '400px', 'marginBottom': '10px'},
                         config={'displayModeBar': False}
                     ),
@@ -285,6 +328,7 @@ def create_home_layout():
                     # Line Chart
                     dcc.Graph(
                         id='line-chart',
+                        figure=create_empty_chart(),
                         style={'height': '300px'},
                         config={'displayModeBar': False}
                     )
@@ -295,7 +339,24 @@ def create_home_layout():
             html.Div([
                 html.Div([
                     html.H6('County Data', style={'marginBottom': '15px'}),
-                    html.Div(id='spread-table')
+                    html.Div(id='spread-table', children=[
+                        # Virtualized: only the visible rows of the 254 counties are in the DOM
+                        dash_table.DataTable(
+                            id='spread-table-dt',
+                            data=[],
+                            columns=[
+                                {'name': 'County', 'id': 'county'},
+                                {'name': 'FIPS', 'id': 'fips'},
+                                {'name': 'Infected', 'id': 'infected', 'type': 'numeric'},
+                                {'name': 'Deceased', 'id': 'deceased', 'type': 'numeric'}
+                            ],
+                            virtualization=True,
+                            fixed_rows={'headers': True},
+                            page_action='none',
+                            sort_action='native',
+                            style_table={'height': '400px', 'overflowY': 'auto'}
+                        )
+                    ])
                 ], className='right-panel')
             ], className='col-lg-3'),
             
@@ -307,16 +368,14 @@ def create_home_layout():
                         'Play',
                         id='play-pause-btn',
                         disabled=True,
-                        style={
-                            'padding': '10px 30px',
-                            'fontSize': '16px',
-                            'backgroundColor': '#28a745',
-                            'color': 'white',
-                            'border': 'none',
-                            'borderRadius': '4px',
-                            'cursor': 'pointer',
-                            'marginRight': '20px'
-                        }
+                        className='btn-play'
+                    ),
+                    
+                    # Reset Button - clears the current run so a new one can be started
+                    html.Button(
+                        'Reset',
+                        id='reset-btn',
+                        className='btn-reset'
                     ),
                     
                     # Timeline Slider
@@ -336,7 +395,10 @@ def create_home_layout():
                     'alignItems': 'center',
                     'justifyContent': 'center',
                     'padding': '20px'
-                })
+                }),
+                
+                # Simulation start failures
+                dbc.Alert(id='simulation-error', color='danger', is_open=False, dismissable=True)
             ], style={'marginTop': '20px'})
         ], className='row')
     ])
@@ -352,9 +414,16 @@ def create_userguide_layout():
         html.Div(id='userguide-content', style={'marginTop': '20px'})
     ])
 
+# Both pages are rendered once; navigation only toggles their visibility
+app.layout['main-content'].children = [
+    html.Div(create_home_layout(), id='home-page'),
+    html.Div(create_userguide_layout(), id='userguide-page', style={'display': 'none'})
+]
+
 # Navigation callback
 @callback(
-    [Output('main-content', 'children'),
+    [Output('home-page', 'style'),
+     Output('userguide-page', 'style'),
      Output('nav-home', 'className'),
      Output('nav-userguide', 'className')],
     [Input('nav-home', 'n_clicks'),
@@ -362,21 +431,10 @@ def create_userguide_layout():
     prevent_initial_call=True
 )
 def navigate_pages(home_clicks, userguide_clicks):
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else 'nav-home'
-    
-    if triggered_id == 'nav-userguide':
-        return create_userguide_layout(), 'tab-button', 'tab-button active'
+    if ctx.triggered_id == 'nav-userguide':
+        return {'display': 'none'}, {'display': 'block'}, 'tab-button', 'tab-button active'
     else:
-        return create_home_layout(), 'tab-button active', 'tab-button'
-
-# Initialize with home page
-@callback(
-    Output('main-content', 'children', allow_duplicate=True),
-    Input('main-content', 'id'),
-    prevent_initial_call='initial_duplicate'
-)
-def init_main_content(_):
-    return create_home_layout()
+        return {'display': 'block'}, {'display': 'none'}, 'tab-button active', 'tab-button'
 
 # Dropdown toggle callback
 @callback(
@@ -393,18 +451,6 @@ def toggle_scenario_dropdown(n_clicks, current_style):
             current_style['display'] = 'none'
     return current_style
 
-# Modal for Disease Parameters
-@callback(
-    Output('disease-params-modal', 'is_open'),
-    [Input('disease-params-btn', 'n_clicks'),
-     Input('disease-params-close', 'n_clicks'),
-     Input('disease-params-save', 'n_clicks')],
-    [State('disease-params-modal', 'is_open')],
-    prevent_initial_call=True
-)
-def toggle_disease_params_modal(open_click, close_click, save_click, is_open):
-    return not is_open
-
 # Disease Parameters Modal Component
 disease_params_modal = dbc.Modal([
     dbc.ModalHeader(dbc.ModalTitle("Disease Parameters")),
@@ -460,7 +506,7 @@ initial_cases_modal = dbc.Modal([
             html.Label('Select Counties'),
             dcc.Dropdown(
                 id='initial-counties',
-                options=[{'label': county, 'value': county} for county in texas_counties],
+                options=[],
                 multi=True,
                 placeholder='Select counties for initial cases',
                 style={'marginBottom': '10px'}
@@ -480,23 +526,92 @@ initial_cases_modal = dbc.Modal([
 # Add modals to layout
 app.layout.children.extend([disease_params_modal, initial_cases_modal])
 
-# Initial Cases Modal toggle
-@callback(
-    Output('initial-cases-modal', 'is_open'),
-    [Input('initial-cases-btn', 'n_clicks'),
-     Input('initial-cases-close', 'n_clicks'),
-     Input('initial-cases-save', 'n_clicks')],
-    [State('initial-cases-modal', 'is_open')],
+# County options are fetched from the static asset (browser-cached) on first open
+app.clientside_callback(
+    """
+    function(isOpen, countiesUrl, options) {
+        if (!isOpen || (options && options.length)) {
+            return window.dash_clientside.no_update;
+        }
+        return fetch(countiesUrl)
+            .then(function(response) {
+                if (!response.ok) {
+                    throw new Error('HTTP ' + response.status);
+                }
+                return response.json();
+            })
+            .then(function(counties) {
+                return counties.map(function(county) { return {label: county, value: county}; });
+            })
+            .catch(function(error) {
+                // Leave the options empty so the next time the modal opens retries the fetch
+                console.error('Could not load Texas counties:', error);
+                return window.dash_clientside.no_update;
+            });
+    }
+    """,
+    Output('initial-counties', 'options'),
+    Input('initial-cases-modal', 'is_open'),
+    [State('counties-store', 'data'),
+     State('initial-counties', 'options')],
     prevent_initial_call=True
 )
-def toggle_initial_cases_modal(open_click, close_click, save_click, is_open):
-    return not is_open
 
-# Save parameters callback
+# Modal toggles and scenario flags - one round-trip per button click
 @callback(
-    [Output('displayed-parameters', 'children'),
+    [Output('disease-params-modal', 'is_open'),
+     Output('initial-cases-modal', 'is_open'),
      Output('play-pause-btn', 'disabled'),
      Output('has-set-scenario', 'data')],
+    [Input('disease-params-btn', 'n_clicks'),
+     Input('disease-params-close', 'n_clicks'),
+     Input('disease-params-save', 'n_clicks'),
+     Input('initial-cases-btn', 'n_clicks'),
+     Input('initial-cases-close', 'n_clicks'),
+     Input('initial-cases-save', 'n_clicks')],
+    [State('disease-params-modal', 'is_open'),
+     State('initial-cases-modal', 'is_open')],
+    prevent_initial_call=True
+)
+def update_modals_and_params(disease_open, disease_close, disease_save, cases_open, cases_close, cases_save,
+                             disease_is_open, cases_is_open):
+    triggered_id = ctx.triggered_id
+    
+    if triggered_id in ('disease-params-btn', 'disease-params-close'):
+        return not disease_is_open, dash.no_update, dash.no_update, dash.no_update
+    if triggered_id in ('initial-cases-btn', 'initial-cases-close'):
+        return dash.no_update, not cases_is_open, dash.no_update, dash.no_update
+    
+    # Save buttons close their modal and enable the simulation
+    if triggered_id == 'disease-params-save':
+        return not disease_is_open, dash.no_update, False, True
+    if triggered_id == 'initial-cases-save':
+        return dash.no_update, not cases_is_open, False, True
+    
+    return dash.no_update, dash.no_update, dash.no_update, dash.no_update
+
+# Displayed parameters are rendered in the browser from the modal inputs
+app.clientside_callback(
+    """
+    function(diseaseSave, casesSave, diseaseName, r0, counties, casesCount) {
+        if (!diseaseSave && !casesSave) {
+            return window.dash_clientside.no_update;
+        }
+        function el(type, children) {
+            return {namespace: 'dash_html_components', type: type, props: {children: children}};
+        }
+        return [
+            el('H6', 'Disease Parameters'),
+            el('P', `Disease: ${diseaseName || 'COVID-19'}`),
+            el('P', `R₀: ${r0 || 2.5}`),
+            el('Hr', null),
+            el('H6', 'Initial Cases'),
+            el('P', `Counties: ${counties ? counties.length : 0} selected`),
+            el('P', `Cases per County: ${casesCount || 100}`)
+        ];
+    }
+    """,
+    Output('displayed-parameters', 'children'),
     [Input('disease-params-save', 'n_clicks'),
      Input('initial-cases-save', 'n_clicks')],
     [State('disease-name', 'value'),
@@ -505,26 +620,13 @@ def toggle_initial_cases_modal(open_click, close_click, save_click, is_open):
      State('initial-cases-count', 'value')],
     prevent_initial_call=True
 )
-def save_parameters(disease_save, cases_save, disease_name, r0, counties, cases_count):
-    if disease_save or cases_save:
-        params_display = [
-            html.H6('Disease Parameters'),
-            html.P(f'Disease: {disease_name or "COVID-19"}'),
-            html.P(f'R₀: {r0 or 2.5}'),
-            html.Hr(),
-            html.H6('Initial Cases'),
-            html.P(f'Counties: {len(counties) if counties else 0} selected'),
-            html.P(f'Cases per County: {cases_count or 100}')
-        ]
-        return params_display, False, True
-    return dash.no_update, True, False
 
 # Play/Pause simulation callback
 @callback(
     [Output('simulation-state', 'data'),
      Output('play-pause-btn', 'children'),
-     Output('play-pause-btn', 'style'),
-     Output('simulation-interval', 'disabled')],
+     Output('play-pause-btn', 'className'),
+     Output('simulation-interval-container', 'children')],
     Input('play-pause-btn', 'n_clicks'),
     [State('simulation-state', 'data'),
      State('has-set-scenario', 'data')],
@@ -534,89 +636,240 @@ def toggle_simulation(n_clicks, sim_state, has_scenario):
     if n_clicks and has_scenario:
         is_running = sim_state.get('isRunning', False)
         
+        # Only the changed keys of the state store are sent
+        state_patch = Patch()
+        interval_patch = Patch()
+        
         if not is_running:
             # Start simulation
-            new_state = {**sim_state, 'isRunning': True, 'currentIndex': 0}
-            button_style = {
-                'padding': '10px 30px',
-                'fontSize': '16px',
-                'backgroundColor': '#ffc107',
-                'color': 'black',
-                'border': 'none',
-                'borderRadius': '4px',
-                'cursor': 'pointer',
-                'marginRight': '20px'
-            }
-            return new_state, 'Pause', button_style, False
+            state_patch['isRunning'] = True
+            state_patch['currentIndex'] = 0
+            interval_patch.append(dcc.Interval(id='simulation-interval', interval=1000))
+            return state_patch, 'Pause', 'btn-pause', interval_patch
         else:
             # Pause simulation
-            new_state = {**sim_state, 'isRunning': False}
-            button_style = {
-                'padding': '10px 30px',
-                'fontSize': '16px',
-                'backgroundColor': '#28a745',
-                'color': 'white',
-                'border': 'none',
-                'borderRadius': '4px',
-                'cursor': 'pointer',
-                'marginRight': '20px'
-            }
-            return new_state, 'Play', button_style, True
+            state_patch['isRunning'] = False
+            interval_patch.clear()
+            return state_patch, 'Play', 'btn-play', interval_patch
     
     return dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
-# Create visualizations
-def create_empty_map():
-    fig = go.Figure()
-    fig.update_layout(
-        title="Texas Counties - No Data Available",
-        geo=dict(
-            scope='usa',
-            projection=go.layout.geo.Projection(type='albers usa'),
-            showlakes=True,
-            lakecolor='rgb(255, 255, 255)',
-        ),
-        height=400
-    )
-    return fig
+def build_simulation_payload(disease_name, r0, beta_scale, tau, kappa, gamma, chi, rho, nu, counties,
+                             cases_count, npis, vaccine_effectiveness, vaccine_adherence, vaccine_stockpile,
+                             antiviral_effectiveness, antiviral_stockpile):
+    """Build the /api/pet/ payload from the form, in the format app.py sends"""
+    texas_mapping = load_texas_mapping()
+    unknown = [county for county in counties or [] if county.casefold() not in texas_mapping]
+    if unknown:
+        raise ValueError(f"Unknown counties: {', '.join(unknown)}")
+    
+    # Default to Harris County when no initial cases are set, like app.py
+    initial_infected = [
+        {'county': texas_mapping[county.casefold()], 'infected': cases_count or 100,
+         'age_group': INITIAL_CASES_AGE_GROUP}
+        for county in counties or []
+    ] or [{'county': '201', 'infected': 100, 'age_group': INITIAL_CASES_AGE_GROUP}]
+    
+    # The checklist has no location or timing inputs; NPIs apply statewide with defaults
+    npi_list = [{
+        'type': npi,
+        'start_day': 5,
+        'duration': 30,
+        'effectiveness': 0.5,
+        'location': ['Statewide']
+    } for npi in npis or []]
+    
+    # Percent inputs are sent as proportions
+    return {
+        'disease_name': disease_name or 'COVID-19',
+        'R0': r0 if r0 is not None else 2.5,
+        'beta_scale': beta_scale if beta_scale is not None else 1.0,
+        'tau': tau if tau is not None else 5.1,
+        'kappa': kappa if kappa is not None else 1.0,
+        'gamma': gamma if gamma is not None else 0.1,
+        'chi': chi if chi is not None else 0.5,
+        'rho': rho if rho is not None else 0.8,
+        'nu': str(nu if nu is not None else 0.01),
+        'initial_infected': json.dumps(initial_infected),
+        'npis': json.dumps(npi_list),
+        'antiviral_effectiveness': (antiviral_effectiveness or 0) / 100,
+        'antiviral_wastage_factor': 0.1,
+        'antiviral_stockpile': json.dumps(antiviral_stockpile),
+        'vaccine_effectiveness': json.dumps((vaccine_effectiveness or 0) / 100),
+        'vaccine_adherence': json.dumps((vaccine_adherence or 0) / 100),
+        'vaccine_stockpile': json.dumps(vaccine_stockpile),
+        'vaccine_wastage_factor': 0.1,
+        'vaccine_pro_rata': 'pro_rata'
+    }
 
-def create_empty_chart():
-    fig = go.Figure()
-    fig.update_layout(
-        title="Epidemic Curve - No Data Available",
-        xaxis_title="Day",
-        yaxis_title="Count",
-        height=300
-    )
-    return fig
+# Create and run the backend simulation when Play first starts it
+@callback(
+    [Output('simulation-state', 'data', allow_duplicate=True),
+     Output('play-pause-btn', 'children', allow_duplicate=True),
+     Output('play-pause-btn', 'className', allow_duplicate=True),
+     Output('simulation-interval-container', 'children', allow_duplicate=True),
+     Output('simulation-error', 'children'),
+     Output('simulation-error', 'is_open')],
+    Input('play-pause-btn', 'n_clicks'),
+    [State('simulation-state', 'data'),
+     State('has-set-scenario', 'data'),
+     State('disease-name', 'value'),
+     State('reproduction-number', 'value'),
+     State('beta-scale', 'value'),
+     State('tau', 'value'),
+     State('kappa', 'value'),
+     State('gamma', 'value'),
+     State('chi', 'value'),
+     State('rho', 'value'),
+     State('nu', 'value'),
+     State('initial-counties', 'value'),
+     State('initial-cases-count', 'value'),
+     State('npi-checklist', 'value'),
+     State('vaccine-effectiveness', 'value'),
+     State('vaccine-adherence', 'value'),
+     State('vaccine-stockpile', 'value'),
+     State('antiviral-effectiveness', 'value'),
+     State('antiviral-stockpile', 'value')],
+    background=True,
+    prevent_initial_call=True
+)
+def start_simulation(n_clicks, sim_state, has_scenario, *form_values):
+    # sim_state is the state before this click; only a first start creates a task
+    if not has_scenario or sim_state.get('isRunning') or sim_state.get('taskId'):
+        raise PreventUpdate
+    
+    try:
+        payload = build_simulation_payload(*form_values)
+    except ValueError as e:
+        error = str(e)
+    else:
+        simulation_id = api_client.create_simulation(payload)
+        task_id = api_client.run_simulation(simulation_id) if simulation_id else None
+        if task_id:
+            state_patch = Patch()
+            state_patch['id'] = simulation_id
+            state_patch['taskId'] = task_id
+            return state_patch, dash.no_update, dash.no_update, dash.no_update, dash.no_update, False
+        error = ('The backend rejected the simulation parameters.' if not simulation_id
+                 else 'The backend could not start the simulation.')
+    
+    # toggle_simulation already switched to running; undo that and show why
+    state_patch = Patch()
+    state_patch['isRunning'] = False
+    interval_patch = Patch()
+    interval_patch.clear()
+    return state_patch, 'Play', 'btn-play', interval_patch, f"Could not start simulation: {error}", True
 
-# Map callback
+# Reset callback - stop the backend task and clear the run so Play creates a new one
 @callback(
+    [Output('simulation-state', 'data', allow_duplicate=True),
+     Output('play-pause-btn', 'children', allow_duplicate=True),
+     Output('play-pause-btn', 'className', allow_duplicate=True),
+     Output('simulation-interval-container', 'children', allow_duplicate=True),
+     Output('line-chart', 'figure', allow_duplicate=True),
+     Output('simulation-error', 'is_open', allow_duplicate=True)],
+    Input('reset-btn', 'n_clicks'),
+    State('simulation-state', 'data'),
+    prevent_initial_call=True
+)
+def reset_simulation(n_clicks, sim_state):
+    if sim_state.get('taskId'):
+        api_client.stop_simulation(sim_state['taskId'])
+    return INITIAL_SIMULATION_STATE, 'Play', 'btn-play', [], create_empty_chart(), False
+
+# Map, chart and table updates run in the browser (assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='updateMap'),
     Output('spread-map', 'figure'),
     [Input('event-data', 'data'),
      Input('timeline-slider', 'value'),
-     Input('view-toggle', 'value')]
+     Input('view-toggle', 'value')],
+    prevent_initial_call=True
 )
-def update_map(event_data, timeline_value, view_type):
-    return create_empty_map()
 
-# Chart callback
-@callback(
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='updateChart'),
     Output('line-chart', 'figure'),
-    Input('event-data', 'data')
+    Input('event-data', 'data'),
+    prevent_initial_call=True
 )
-def update_chart(event_data):
-    return create_empty_chart()
 
-# Table callback
-@callback(
-    Output('spread-table', 'children'),
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='updateTable'),
+    Output('spread-table-dt', 'data'),
     [Input('event-data', 'data'),
      Input('timeline-slider', 'value'),
-     Input('view-toggle', 'value')]
+     Input('view-toggle', 'value')],
+    State('county-names', 'data'),
+    prevent_initial_call=True
 )
-def update_table(event_data, timeline_value, view_type):
-    return html.P('No data available', style={'color': '#6c757d', 'fontStyle': 'italic'})
+
+# Simulation stream - open/close the EventSource as the simulation starts/stops
+app.clientside_callback(
+    ClientsideFunction(namespace='sse', function_name='toggleStream'),
+    Output('sim-stream-status', 'data'),
+    Input('simulation-state', 'data'),
+    prevent_initial_call=True
+)
+
+# Streamed frames are drawn through extendData so Dash's copy of the figure stays current
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='appendStreamFrames'),
+    [Output('line-chart', 'figure', allow_duplicate=True),
+     Output('line-chart', 'extendData')],
+    Input('sim-stream-frames', 'data'),
+    State('line-chart', 'figure'),
+    prevent_initial_call=True
+)
+
+# Totals streamed per day, in line chart trace order
+STREAM_TOTAL_KEYS = ['S', 'E', 'A', 'T', 'I', 'R', 'D']
+
+# The backend stops storing output after this many days (see backend/pet/pes_task.py)
+MAX_SIMULATION_DAYS = 90
+
+# Close the stream when no new day arrives for this long (task finished or was stopped)
+STREAM_IDLE_TIMEOUT = 60
+
+# Each open stream holds a server thread while it polls the backend, so run
+# app_fixed under a threaded worker (gunicorn --worker-class gthread, see README)
+@app.server.route('/sim/stream')
+def stream_simulation():
+    """Server-sent events with one frame per new simulation day, starting at ?from=<day>"""
+    # A browser reconnect resumes after the last frame it received
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if last_event_id.isdigit():
+        start_day = int(last_event_id) + 1
+    else:
+        start_day = max(request.args.get('from', 0, type=int), 0)
+    
+    def generate():
+        day = start_day
+        last_frame_time = time.monotonic()
+        while day < MAX_SIMULATION_DAYS:
+            output = api_client.get_simulation_output(day)
+            if not output:
+                if time.monotonic() - last_frame_time > STREAM_IDLE_TIMEOUT:
+                    break
+                # Day not ready yet; comment lines keep the connection alive
+                yield ': waiting\n\n'
+                time.sleep(1)
+                continue
+            
+            totals = output.get('total_summary', {})
+            frame = {
+                'day': output.get('day', day),
+                'totals': [totals.get(key, 0) for key in STREAM_TOTAL_KEYS]
+            }
+            yield f"id: {day}\ndata: {orjson.dumps(frame).decode()}\n\n"
+            day += 1
+            last_frame_time = time.monotonic()
+        
+        # Tell the client to close instead of letting EventSource reconnect
+        yield 'event: end\ndata: {}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
 # User Guide content callback
 @callback(
@@ -358,6 +358,8 @@ def render_userguide_content(active_tab):
 app.layout = dbc.Container([
     dcc.Store(id='simulation-state', data={'is_running': False, 'current_index': 0, 'task_id': None, 'simulation_id': None}),
     dcc.Store(id='event-data', data=[]),
+    # Whether spread-map currently shows a full choropleth trace that can be patched
+    dcc.Store(id='spread-map-is-choropleth', data=False),
     dcc.Store(id='simulation-parameters', data={}),
     dcc.Interval(id='simulation-interval', interval=1000, n_intervals=0, disabled=True),
     
@@ -541,18 +543,27 @@ def toggle_simulation(n_clicks, sim_state, sim_params):
 
 # Map visualization callback
 @callback(
-    Output('spread-map', 'figure'),
+    [Output('spread-map', 'figure'),
+     Output('spread-map-is-choropleth', 'data')],
     [Input('event-data', 'data'),
      Input('timeline-slider', 'value'),
      Input('view-toggle', 'value')],
+    State('spread-map-is-choropleth', 'data'),
     prevent_initial_call=False
 )
-def update_map(event_data, timeline_value, view_type):
+def update_map(event_data, timeline_value, view_type, is_choropleth):
     try:
-        return viz_generator.create_choropleth_map(event_data or [], timeline_value or 0, view_type or 'percent')
+        # Scrubbing the timeline only changes the day, so patch the rendered map -
+        # unless it is the empty placeholder, which has no trace to patch
+        if ctx.triggered_id == 'timeline-slider' and is_choropleth:
+            patched_map = viz_generator.update_choropleth(event_data or [], timeline_value or 0, view_type or 'percent')
+            if patched_map is not None:
+                return patched_map, True
+        figure = viz_generator.create_choropleth_map(event_data or [], timeline_value or 0, view_type or 'percent')
+        return figure, bool(figure['data'])
     except Exception as e:
         logger.error(f"Error updating map: {e}")
-        return viz_generator.create_choropleth_map([], 0, 'percent')
+        return viz_generator.create_choropleth_map([], 0, 'percent'), False
 
 # Line chart callback
 @callback(
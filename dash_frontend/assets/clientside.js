@@ -0,0 +1,154 @@
+/* Clientside callbacks for the spread map, line chart and county table */
+
+// Line chart traces are reduced to at most this many points (first/min/max/last per bucket)
+var MAX_CHART_POINTS = 1000;
+
+// SEATIRD line chart traces: [name, event data key, color]; /sim/stream sends totals in this order
+var SEATIRD_COMPARTMENTS = [
+    ['Susceptible', 'totalSusceptible', 'blue'],
+    ['Exposed', 'totalExposed', 'orange'],
+    ['Asymptomatic', 'totalAsymptomaticCount', 'yellow'],
+    ['Treatable', 'totalTreatableCount', 'purple'],
+    ['Infected', 'totalInfectedCount', 'red'],
+    ['Recovered', 'totalRecoveredCount', 'green'],
+    ['Deceased', 'totalDeceased', 'black']
+];
+
+// Keep the first, min, max and last point of each bucket so peaks survive
+function downsampleMinMax(x, y, maxPoints) {
+    var n = x.length;
+    if (n <= maxPoints) {
+        return {x: x, y: y};
+    }
+
+    // Up to four points per bucket
+    var buckets = Math.floor(maxPoints / 4);
+    var size = n / buckets;
+    var outX = [];
+    var outY = [];
+    for (var b = 0; b < buckets; b++) {
+        var start = Math.floor(b * size);
+        var end = Math.min(n, Math.floor((b + 1) * size));
+        var iMin = start;
+        var iMax = start;
+        for (var i = start + 1; i < end; i++) {
+            if (y[i] < y[iMin]) { iMin = i; }
+            if (y[i] > y[iMax]) { iMax = i; }
+        }
+        // Emit in index order, skipping repeats
+        var picks = [start, iMin, iMax, end - 1].sort(function(p, q) { return p - q; });
+        for (var k = 0; k < picks.length; k++) {
+            if (k === 0 || picks[k] !== picks[k - 1]) {
+                outX.push(x[picks[k]]);
+                outY.push(y[picks[k]]);
+            }
+        }
+    }
+    return {x: outX, y: outY};
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    viz: {
+        updateMap: function(eventData, timelineValue, viewType) {
+            return {
+                data: [],
+                layout: {
+                    title: 'Texas Counties - No Data Available',
+                    geo: {
+                        scope: 'usa',
+                        projection: {type: 'albers usa'},
+                        showlakes: true,
+                        lakecolor: 'rgb(255, 255, 255)'
+                    },
+                    height: 400
+                }
+            };
+        },
+
+        updateChart: function(eventData) {
+            var hasData = eventData && eventData.length > 0;
+            var days = hasData ? eventData.map(function(d) { return d.day; }) : [];
+
+            return {
+                data: !hasData ? [] : SEATIRD_COMPARTMENTS.map(function(c) {
+                    var points = downsampleMinMax(
+                        days,
+                        eventData.map(function(d) { return d[c[1]] || 0; }),
+                        MAX_CHART_POINTS
+                    );
+                    return {
+                        type: 'scattergl',
+                        mode: 'lines',
+                        name: c[0],
+                        x: points.x,
+                        y: points.y,
+                        line: {color: c[2], width: 2}
+                    };
+                }),
+                layout: {
+                    title: hasData ? 'Epidemic Curve - SEATIRD Model' : 'Epidemic Curve - No Data Available',
+                    xaxis: {title: 'Day'},
+                    yaxis: {title: 'Count'},
+                    dragmode: 'pan',
+                    height: 300
+                }
+            };
+        },
+
+        // Streamed days (assets/sse.js) go through the line chart's extendData, so
+        // Dash's stored figure stays in sync; the first batch seeds the traces
+        appendStreamFrames: function(frameSeq, figure) {
+            var frames = window.dash_clientside.sse.takeFrames();
+            if (!frames.length) {
+                return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+            }
+            var x = SEATIRD_COMPARTMENTS.map(function() {
+                return frames.map(function(frame) { return frame.day; });
+            });
+            var y = SEATIRD_COMPARTMENTS.map(function(c, i) {
+                return frames.map(function(frame) { return frame.totals[i]; });
+            });
+
+            if (!figure || !figure.data || figure.data.length !== SEATIRD_COMPARTMENTS.length) {
+                return [{
+                    data: SEATIRD_COMPARTMENTS.map(function(c, i) {
+                        return {
+                            type: 'scattergl',
+                            mode: 'lines',
+                            name: c[0],
+                            x: x[i],
+                            y: y[i],
+                            line: {color: c[2], width: 2}
+                        };
+                    }),
+                    layout: {
+                        title: 'Epidemic Curve - SEATIRD Model',
+                        xaxis: {title: 'Day'},
+                        yaxis: {title: 'Count'},
+                        dragmode: 'pan',
+                        height: 300
+                    }
+                }, window.dash_clientside.no_update];
+            }
+            var indices = SEATIRD_COMPARTMENTS.map(function(c, i) { return i; });
+            return [window.dash_clientside.no_update, [{x: x, y: y}, indices]];
+        },
+
+        updateTable: function(eventData, timelineValue, viewType, countyNames) {
+            if (!eventData || timelineValue >= eventData.length) {
+                return [];
+            }
+            var percent = viewType === 'percent';
+            var names = countyNames || {};
+            var counties = eventData[timelineValue].counties || [];
+            return counties.map(function(county) {
+                return {
+                    county: names[county.fips] || county.fips,
+                    fips: county.fips,
+                    infected: percent ? Math.round((county.infectedPercent || 0) * 10) / 10 : (county.infected || 0),
+                    deceased: percent ? Math.round((county.deceasedPercent || 0) * 10) / 10 : (county.deceased || 0)
+                };
+            });
+        }
+    }
+});
@@ -0,0 +1,59 @@
+/* Server-sent simulation frames, queued for the line chart's extendData callback
+ *
+ * This file only owns the EventSource and the frame queue. Turning frames into
+ * line chart traces is viz.appendStreamFrames in clientside.js, which drains
+ * the queue through window.dash_clientside.sse.takeFrames().
+ */
+
+(function() {
+    var source = null;
+    // Task being streamed and the next day it still needs, so a resumed stream continues
+    var streamTaskId = null;
+    var nextDay = 0;
+    // Frames received but not yet drawn; drained as a batch by the chart callback
+    var pendingFrames = [];
+    var frameSeq = 0;
+
+    function closeStream() {
+        if (source) {
+            source.close();
+            source = null;
+        }
+    }
+
+    function queueFrame(event) {
+        pendingFrames.push(JSON.parse(event.data));
+        nextDay = Number(event.lastEventId) + 1;
+        // Bump the store so Dash runs the extendData callback; a skipped bump
+        // loses nothing because the callback drains every pending frame
+        window.dash_clientside.set_props('sim-stream-frames', {data: ++frameSeq});
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        sse: {
+            toggleStream: function(simState) {
+                var taskId = simState && simState.isRunning ? simState.taskId : null;
+                closeStream();
+                if (!taskId) {
+                    return 'closed';
+                }
+                if (taskId !== streamTaskId) {
+                    streamTaskId = taskId;
+                    nextDay = 0;
+                    pendingFrames = [];
+                }
+                source = new EventSource('/sim/stream?from=' + nextDay);
+                source.onmessage = queueFrame;
+                // Sent once the last day has streamed; stops EventSource reconnecting
+                source.addEventListener('end', closeStream);
+                return 'open';
+            },
+
+            takeFrames: function() {
+                var frames = pendingFrames;
+                pendingFrames = [];
+                return frames;
+            }
+        }
+    });
+})();
@@ -1,10 +1,17 @@
 import json
 import pandas as pd
 import logging
+import os
 from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Simplified county boundaries, generated by scripts/optimize_geojson.py (in the Docker build, or on first use)
+TEXAS_OUTLINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'texasOutlineSimplified.json')
+
+# Full-resolution county boundaries the simplified file is generated from
+TEXAS_OUTLINE_FULL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'texasOutline.json')
+
 class DataLoader:
     """Handles loading and parsing of Texas counties and other data files"""
     
@@ -13,6 +20,8 @@ class DataLoader:
         self._texas_counties = None
         self._texas_all_counties = None
         self._texas_mapping = None
+        self._texas_outline = None
+        self._fips_name_map = None
         
     def load_texas_counties(self) -> List[Dict[str, Any]]:
         """Load Texas counties data"""
@@ -84,6 +93,45 @@ class DataLoader:
             
         return self._texas_mapping
     
+    def load_texas_outline(self) -> Dict[str, Any]:
+        """Load simplified Texas county boundaries as GeoJSON keyed by FIPS code"""
+        if self._texas_outline is not None:
+            return self._texas_outline
+            
+        try:
+            with open(TEXAS_OUTLINE_PATH, 'r') as f:
+                self._texas_outline = json.load(f)
+        except FileNotFoundError:
+            self._texas_outline = self._generate_texas_outline()
+            
+        return self._texas_outline
+    
+    def _generate_texas_outline(self) -> Dict[str, Any]:
+        """Generate the simplified outline on first use; full resolution if that is not possible"""
+        try:
+            from scripts import optimize_geojson
+            outline = optimize_geojson.optimize()
+            logger.info(f"Generated {TEXAS_OUTLINE_PATH}")
+            return outline
+        except (ImportError, OSError) as e:
+            logger.error(f"texasOutlineSimplified.json is missing and could not be generated ({e}). "
+                         "Every map render will embed the ~16 MB full-resolution outline; run "
+                         "`pip install -r requirements-build.txt && python scripts/optimize_geojson.py`.")
+            return self._load_full_texas_outline()
+    
+    def _load_full_texas_outline(self) -> Dict[str, Any]:
+        """Load the unsimplified county boundaries, keyed by FIPS code like the simplified file"""
+        try:
+            with open(TEXAS_OUTLINE_FULL_PATH, 'r') as f:
+                outline = json.load(f)
+        except FileNotFoundError:
+            logger.warning("texasOutline.json not found, using mock data")
+            return self._create_mock_mapping()
+        
+        for feature in outline['features']:
+            feature['id'] = feature['properties']['geoid']
+        return outline
+    
     def _create_mock_counties(self) -> List[Dict[str, Any]]:
         """Create mock county data for development"""
         return [
@@ -118,11 +166,13 @@ class DataLoader:
             "features": [
                 {
                     "type": "Feature",
+                    "id": "48201",
                     "properties": {"FIPS": "48201", "NAME": "Harris County"},
                     "geometry": {"type": "Polygon", "coordinates": [[[-95.9, 29.5], [-95.0, 29.5], [-95.0, 30.1], [-95.9, 30.1], [-95.9, 29.5]]]}
                 },
                 {
                     "type": "Feature", 
+                    "id": "48113",
                     "properties": {"FIPS": "48113", "NAME": "Dallas County"},
                     "geometry": {"type": "Polygon", "coordinates": [[[-97.0, 32.6], [-96.4, 32.6], [-96.4, 33.0], [-97.0, 33.0], [-97.0, 32.6]]]}
                 }
@@ -139,10 +189,13 @@ class DataLoader:
         counties = self.load_texas_all_counties()
         return [{"label": county["name"], "value": county["fips"]} for county in counties]
     
+    def get_fips_name_map(self) -> Dict[str, str]:
+        """Get a FIPS code to county name mapping for all counties"""
+        if self._fips_name_map is None:
+            counties = self.load_texas_all_counties()
+            self._fips_name_map = {county["fips"]: county["name"] for county in counties}
+        return self._fips_name_map
+    
     def get_county_name_by_fips(self, fips: str) -> str:
         """Get county name by FIPS code"""
-        counties = self.load_texas_all_counties()
-        for county in counties:
-            if county["fips"] == fips:
-                return county["name"]
-        return f"County {fips}"
\ No newline at end of file
+        return self.get_fips_name_map().get(fips, f"County {fips}")
\ No newline at end of file
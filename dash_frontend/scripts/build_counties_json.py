@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Convert the texasCounties.js county list into assets/texas_counties.json
+so the Dash app can load it with a single json.load at startup.
+"""
+import json
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(BASE_DIR, 'texasCounties.js')
+TARGET = os.path.join(BASE_DIR, 'assets', 'texas_counties.json')
+
+
+def read_counties(filename):
+    with open(filename, 'r') as f:
+        content = f.read()
+
+    counties = []
+    for line in content.split('\n'):
+        line = line.strip().rstrip(',')
+        if len(line) > 1 and line[0] == line[-1] and line[0] in '\'"':
+            counties.append(line[1:-1])
+    return counties
+
+
+def write_json(filename, counties):
+    with open(filename, 'w') as f:
+        json.dump(counties, f, indent=2)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    counties = read_counties(SOURCE)
+    write_json(TARGET, counties)
+    print(f'Wrote {len(counties)} counties to {TARGET}')
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Simplify the full-resolution texasOutline.json county boundaries into
+texasOutlineSimplified.json, which is what the Dash choropleth loads.
+
+Requires the build-time only `topojson` package (requirements-build.txt);
+the Dockerfile runs this script in a separate build stage, and
+data_loader.py runs it on first use when topojson is installed locally.
+Simplification runs on the shared-arc topology so neighbouring counties
+keep matching borders, and the result is written back out as GeoJSON
+because Plotly's Choropleth trace only accepts GeoJSON.
+"""
+import json
+import os
+
+import topojson
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(BASE_DIR, 'texasOutline.json')
+TARGET = os.path.join(BASE_DIR, 'texasOutlineSimplified.json')
+
+# Douglas-Peucker tolerance in degrees (~1 km), well below county scale
+TOLERANCE = 0.01
+
+
+def read_counties(filename):
+    with open(filename, 'r') as f:
+        outline = json.load(f)
+
+    # Keep only what the map needs: the 5-digit FIPS code and the county name
+    features = [{
+        'type': 'Feature',
+        'properties': {'fips': feature['properties']['geoid'], 'name': feature['properties']['name']},
+        'geometry': feature['geometry'],
+    } for feature in outline['features']]
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def simplify(geojson):
+    topo = topojson.Topology(geojson, prequantize=True)
+    simplified = json.loads(topo.toposimplify(TOLERANCE).to_geojson())
+
+    # Plotly's locationmode='geojson-id' matches locations against feature ids
+    for feature in simplified['features']:
+        feature['id'] = feature['properties']['fips']
+    return simplified
+
+
+def write_json(filename, geojson):
+    with open(filename, 'w') as f:
+        json.dump(geojson, f, separators=(',', ':'))
+
+
+def optimize():
+    counties = simplify(read_counties(SOURCE))
+    write_json(TARGET, counties)
+    return counties
+
+
+if __name__ == '__main__':
+    counties = optimize()
+    print(f'Wrote {len(counties["features"])} counties to {TARGET} '
+          f'({os.path.getsize(SOURCE) // 1024} KB -> {os.path.getsize(TARGET) // 1024} KB)')
@@ -1,56 +1,161 @@
-import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
+import plotly.io as pio
+from dash import Patch
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
+import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Per-county fields read from each day's event data
+COUNTY_FIELDS = ['fips', 'infected', 'deceased', 'infectedPercent', 'deceasedPercent']
+
+# SEATIRD compartment traces on the epidemic curve: (name, column, line style)
+LINE_CHART_TRACES = [
+    ('Susceptible', 'totalSusceptible', dict(color='blue')),
+    ('Exposed', 'totalExposed', dict(color='orange')),
+    ('Asymptomatic', 'totalAsymptomaticCount', dict(color='yellow')),
+    ('Treatable', 'totalTreatableCount', dict(color='purple')),
+    ('Infected', 'totalInfectedCount', dict(color='red', width=3)),
+    ('Recovered', 'totalRecoveredCount', dict(color='green')),
+    ('Deceased', 'totalDeceased', dict(color='black')),
+]
+LINE_CHART_COLUMNS = ['day'] + [column for _, column, _ in LINE_CHART_TRACES]
+
+# plotly.py's default template, embedded explicitly since dict figures skip go.Figure
+PLOTLY_TEMPLATE = pio.templates['plotly'].to_plotly_json()
+
+# Trace defaults shared by every compartment, sent once instead of per trace
+LINE_CHART_TEMPLATE = {
+    'layout': PLOTLY_TEMPLATE['layout'],
+    'data': {
+        **PLOTLY_TEMPLATE['data'],
+        'scattergl': [{
+            'hovertemplate': 'Day %{x}<br>%{data.name}: %{y:,}<extra></extra>',
+            'line': {'width': 2}
+        }]
+    }
+}
+
+# Maximum number of figures/tables kept in the render cache
+RENDER_CACHE_SIZE = 100
+
+# Placeholder figures for missing data, built once and shared (never mutate)
+EMPTY_MAP_FIGURE = {
+    'data': [],
+    'layout': dict(
+        title="Texas Counties - No Data Available",
+        geo=dict(
+            scope='usa',
+            projection=dict(type='albers usa'),
+            showlakes=True,
+            lakecolor='rgb(255, 255, 255)',
+            center=dict(lat=31.0, lon=-99.0),
+            lonaxis=dict(range=[-106.0, -93.0]),
+            lataxis=dict(range=[25.0, 37.0])
+        ),
+        height=400,
+        margin=dict(l=0, r=0, t=40, b=0),
+        template=PLOTLY_TEMPLATE
+    )
+}
+
+EMPTY_LINE_CHART_FIGURE = {
+    'data': [],
+    'layout': dict(
+        title="Epidemic Curve - No Data Available",
+        xaxis=dict(title="Day"),
+        yaxis=dict(title="Population Count"),
+        height=300,
+        margin=dict(l=40, r=40, t=60, b=40),
+        template=PLOTLY_TEMPLATE
+    )
+}
+
+def _format_percent(values: pd.Series) -> pd.Series:
+    """Format a column as one-decimal percentages"""
+    return values.astype(float).map('{:.1f}%'.format)
+
+def _format_count(values: pd.Series) -> pd.Series:
+    """Format a column as counts with thousands separators"""
+    return values.map('{:,}'.format)
+
+def _view_columns(view_type: str):
+    """Get the infected/deceased columns and column formatter for a view type"""
+    if view_type == 'percent':
+        return 'infectedPercent', 'deceasedPercent', _format_percent
+    return 'infected', 'deceased', _format_count
+
+def _county_frame(counties_data: List[Dict], fips_to_name: pd.Series) -> pd.DataFrame:
+    """Build one row per county with names resolved and missing values zeroed"""
+    df = pd.DataFrame(counties_data).reindex(columns=COUNTY_FIELDS)
+    df['fips'] = df['fips'].fillna('')
+    df = df.fillna(0)
+    # Missing counts make reindex produce float columns; restore integers for '{:,}',
+    # but keep fractional counts (the backend stores doubles) as they are
+    counts = df[['infected', 'deceased']]
+    if (counts % 1 == 0).all().all():
+        df[['infected', 'deceased']] = counts.astype('int64')
+    df['name'] = df['fips'].map(fips_to_name).fillna('County ' + df['fips'].astype(str))
+    return df
+
+def _hover_text(df: pd.DataFrame, view_type: str) -> pd.Series:
+    """Build the choropleth hover text for every row of a county frame"""
+    infected_col, deceased_col, fmt = _view_columns(view_type)
+    return (df['name'] + '<br>Infected: ' + fmt(df[infected_col])
+            + '<br>Deceased: ' + fmt(df[deceased_col]))
+
+def _choropleth_values(counties_data: List[Dict], view_type: str, fips_to_name: pd.Series):
+    """Get the FIPS codes, z values and hover text for one day of county data"""
+    df = _county_frame(counties_data, fips_to_name)
+    infected_col = _view_columns(view_type)[0]
+    return df['fips'].tolist(), df[infected_col].to_numpy(), _hover_text(df, view_type).tolist()
+
 class VisualizationGenerator:
     """Handles creation of visualizations for the pandemic simulation"""
     
     def __init__(self, data_loader):
         self.data_loader = data_loader
+        self._fips_to_name = pd.Series(data_loader.get_fips_name_map(), dtype=object)
+        self._texas_geojson = None
+        self._texas_geojson_loaded = False
+        self._render_cache = OrderedDict()
+        self._render_cache_lock = threading.Lock()
         
     def create_choropleth_map(self, event_data: List[Dict], timeline_value: int, 
-                            view_type: str = 'percent') -> go.Figure:
+                            view_type: str = 'percent') -> Dict[str, Any]:
         """Create a choropleth map of Texas counties"""
         
         if not event_data or timeline_value >= len(event_data):
             return self._create_empty_map()
         
         current_data = event_data[timeline_value]
+        key = ('map', self._fingerprint(current_data), view_type)
+        return self._copy_figure(self._cached(key, lambda: self._build_choropleth_map(current_data, view_type)))
+    
+    def _build_choropleth_map(self, current_data: Dict, view_type: str) -> Dict[str, Any]:
+        """Build the choropleth map for a single day of event data"""
         counties_data = current_data.get('counties', [])
         
         if not counties_data:
             return self._create_empty_map()
         
         # Prepare data for choropleth
-        fips_codes = []
-        values = []
-        hover_text = []
-        
-        for county in counties_data:
-            fips = county.get('fips', '')
-            county_name = self.data_loader.get_county_name_by_fips(fips)
-            
-            if view_type == 'percent':
-                infected_val = county.get('infectedPercent', 0)
-                deceased_val = county.get('deceasedPercent', 0)
-                hover_text.append(f"{county_name}<br>Infected: {infected_val:.1f}%<br>Deceased: {deceased_val:.1f}%")
-            else:
-                infected_val = county.get('infected', 0)
-                deceased_val = county.get('deceased', 0)
-                hover_text.append(f"{county_name}<br>Infected: {infected_val:,}<br>Deceased: {deceased_val:,}")
-            
-            fips_codes.append(fips)
-            values.append(infected_val)
+        values = _choropleth_values(counties_data, view_type, self._fips_to_name)
+        return self._map_figure(current_data, view_type, values)
+    
+    def _map_figure(self, current_data: Dict, view_type: str, values) -> Dict[str, Any]:
+        """Assemble the choropleth figure from one day's precomputed county values"""
+        fips_codes, z, hover_text = values
         
         # Create choropleth map
-        fig = go.Figure(data=go.Choropleth(
-            locations=fips_codes,
-            z=values,
-            locationmode='geojson-id',
+        trace = dict(
+            type='choropleth',
+            **self._location_kwargs(fips_codes),
+            z=z,
             colorscale='Reds',
             text=hover_text,
             hovertemplate='%{text}<extra></extra>',
@@ -59,115 +164,92 @@ class VisualizationGenerator:
                 thickness=15,
                 len=0.7
             )
-        ))
-        
-        # Try to load Texas GeoJSON if available
-        try:
-            texas_geojson = self.data_loader.load_texas_mapping()
-            fig.update_traces(geojson=texas_geojson)
-        except:
-            # Fallback to state-level choropleth
-            fig.update_traces(
-                locations=['TX'] * len(fips_codes),
-                locationmode='USA-states'
-            )
+        )
         
-        fig.update_layout(
-            title=f"Day {current_data['day']} - Texas Counties ({'Percentage' if view_type == 'percent' else 'Count'} View)",
+        layout = dict(
+            title=self._map_title(current_data, view_type),
             geo=dict(
                 scope='usa',
-                projection=go.layout.geo.Projection(type='albers usa'),
+                projection=dict(type='albers usa'),
                 showlakes=True,
                 lakecolor='rgb(255, 255, 255)',
                 center=dict(lat=31.0, lon=-99.0),  # Center on Texas
-                lonaxis_range=[-106.0, -93.0],
-                lataxis_range=[25.0, 37.0]
+                lonaxis=dict(range=[-106.0, -93.0]),
+                lataxis=dict(range=[25.0, 37.0]),
+                uirevision='texas-geo'
             ),
             height=400,
-            margin=dict(l=0, r=0, t=40, b=0)
+            margin=dict(l=0, r=0, t=40, b=0),
+            template=PLOTLY_TEMPLATE,
+            # Keep the user's pan/zoom and legend state across day updates
+            uirevision='texas-choropleth'
         )
         
-        return fig
+        return {'data': [trace], 'layout': layout}
     
-    def create_line_chart(self, event_data: List[Dict], npi_data: Optional[List] = None) -> go.Figure:
-        """Create epidemic curve line chart"""
-        
-        if not event_data:
-            return self._create_empty_line_chart()
-        
-        days = [d['day'] for d in event_data]
-        
-        # Extract compartment data
-        susceptible = [d.get('totalSusceptible', 0) for d in event_data]
-        exposed = [d.get('totalExposed', 0) for d in event_data]
-        asymptomatic = [d.get('totalAsymptomaticCount', 0) for d in event_data]
-        treatable = [d.get('totalTreatableCount', 0) for d in event_data]
-        infected = [d.get('totalInfectedCount', 0) for d in event_data]
-        recovered = [d.get('totalRecoveredCount', 0) for d in event_data]
-        deceased = [d.get('totalDeceased', 0) for d in event_data]
-        
-        fig = go.Figure()
-        
-        # Add traces for each compartment
-        fig.add_trace(go.Scatter(
-            x=days, y=susceptible, name='Susceptible',
-            line=dict(color='blue', width=2),
-            hovertemplate='Day %{x}<br>Susceptible: %{y:,}<extra></extra>'
-        ))
+    def update_choropleth(self, event_data: List[Dict], timeline_value: int,
+                          view_type: str = 'percent') -> Optional[Patch]:
+        """Patch the day-dependent parts of a rendered choropleth (not the empty map); None if it needs a full rebuild"""
+        if not event_data or timeline_value >= len(event_data):
+            return None
         
-        fig.add_trace(go.Scatter(
-            x=days, y=exposed, name='Exposed',
-            line=dict(color='orange', width=2),
-            hovertemplate='Day %{x}<br>Exposed: %{y:,}<extra></extra>'
-        ))
+        current_data = event_data[timeline_value]
+        counties_data = current_data.get('counties', [])
+        if not counties_data:
+            return None
         
-        fig.add_trace(go.Scatter(
-            x=days, y=asymptomatic, name='Asymptomatic',
-            line=dict(color='yellow', width=2),
-            hovertemplate='Day %{x}<br>Asymptomatic: %{y:,}<extra></extra>'
-        ))
+        fips_codes, z, hover_text = _choropleth_values(counties_data, view_type, self._fips_to_name)
         
-        fig.add_trace(go.Scatter(
-            x=days, y=treatable, name='Treatable',
-            line=dict(color='purple', width=2),
-            hovertemplate='Day %{x}<br>Treatable: %{y:,}<extra></extra>'
-        ))
+        patched_fig = Patch()
+        patched_fig['data'][0]['locations'] = self._location_kwargs(fips_codes)['locations']
+        patched_fig['data'][0]['z'] = z.tolist()
+        patched_fig['data'][0]['text'] = hover_text
+        patched_fig['layout']['title'] = self._map_title(current_data, view_type)
+        return patched_fig
+    
+    def create_line_chart(self, event_data: List[Dict], npi_data: Optional[List] = None) -> Dict[str, Any]:
+        """Create epidemic curve line chart"""
         
-        fig.add_trace(go.Scatter(
-            x=days, y=infected, name='Infected',
-            line=dict(color='red', width=3),
-            hovertemplate='Day %{x}<br>Infected: %{y:,}<extra></extra>'
-        ))
+        if not event_data:
+            return self._create_empty_line_chart()
         
-        fig.add_trace(go.Scatter(
-            x=days, y=recovered, name='Recovered',
-            line=dict(color='green', width=2),
-            hovertemplate='Day %{x}<br>Recovered: %{y:,}<extra></extra>'
-        ))
+        # Only the totals feed the chart; leave the per-day county lists out of the key
+        totals = [[day.get(column) for column in LINE_CHART_COLUMNS] for day in event_data]
+        key = ('line', self._fingerprint([totals, npi_data]))
+        return self._copy_figure(self._cached(key, lambda: self._build_line_chart(event_data, npi_data)))
+    
+    def _build_line_chart(self, event_data: List[Dict], npi_data: Optional[List]) -> Dict[str, Any]:
+        """Build the epidemic curve for the full event data"""
+        df = pd.DataFrame(event_data).reindex(columns=LINE_CHART_COLUMNS).fillna(0)
+        days = df['day'].to_numpy()
         
-        fig.add_trace(go.Scatter(
-            x=days, y=deceased, name='Deceased',
-            line=dict(color='black', width=2),
-            hovertemplate='Day %{x}<br>Deceased: %{y:,}<extra></extra>'
-        ))
+        traces = [
+            dict(type='scattergl', x=days, y=df[column].to_numpy(), name=name, line=line)
+            for name, column, line in LINE_CHART_TRACES
+        ]
         
         # Add NPI indicators if available
+        shapes, annotations = [], []
         if npi_data:
+            last_day = days.max()
             for npi in npi_data:
                 start_day = npi.get('start_day', 0)
-                if start_day <= max(days):
-                    fig.add_vline(
-                        x=start_day,
-                        line_dash="dash",
-                        line_color="gray",
-                        annotation_text=f"NPI: {npi.get('type', 'Unknown')}",
-                        annotation_position="top"
-                    )
-        
-        fig.update_layout(
+                if start_day <= last_day:
+                    shapes.append(dict(
+                        type='line', xref='x', yref='paper',
+                        x0=start_day, x1=start_day, y0=0, y1=1,
+                        line=dict(color='gray', dash='dash')
+                    ))
+                    annotations.append(dict(
+                        xref='x', yref='paper', x=start_day, y=1,
+                        text=f"NPI: {npi.get('type', 'Unknown')}",
+                        showarrow=False, yanchor='bottom'
+                    ))
+        
+        layout = dict(
             title="Epidemic Curve - SEATIRD Model",
-            xaxis_title="Day",
-            yaxis_title="Population Count",
+            xaxis=dict(title="Day"),
+            yaxis=dict(title="Population Count"),
             height=300,
             legend=dict(
                 orientation="h",
@@ -177,10 +259,14 @@ class VisualizationGenerator:
                 x=1
             ),
             margin=dict(l=40, r=40, t=60, b=40),
-            hovermode='x unified'
+            hovermode='x unified',
+            template=LINE_CHART_TEMPLATE,
+            uirevision='epi-curve',
+            shapes=shapes,
+            annotations=annotations
         )
         
-        return fig
+        return {'data': traces, 'layout': layout}
     
     def create_summary_table(self, event_data: List[Dict], timeline_value: int, 
                            view_type: str = 'percent', sort_config: Dict = None) -> pd.DataFrame:
@@ -190,84 +276,92 @@ class VisualizationGenerator:
             return pd.DataFrame()
         
         current_data = event_data[timeline_value]
+        key = ('table', self._fingerprint([current_data, sort_config]), view_type)
+        return self._cached(key, lambda: self._build_summary_table(current_data, view_type, sort_config)).copy()
+    
+    def _build_summary_table(self, current_data: Dict, view_type: str,
+                             sort_config: Optional[Dict]) -> pd.DataFrame:
+        """Build the summary table for a single day of event data"""
         counties_data = current_data.get('counties', [])
         
         if not counties_data:
             return pd.DataFrame()
         
         # Prepare table data
-        table_data = []
-        for county in counties_data:
-            fips = county.get('fips', '')
-            county_name = self.data_loader.get_county_name_by_fips(fips)
-            
-            if view_type == 'percent':
-                infected_val = f"{county.get('infectedPercent', 0):.1f}%"
-                deceased_val = f"{county.get('deceasedPercent', 0):.1f}%"
-                infected_sort = county.get('infectedPercent', 0)
-                deceased_sort = county.get('deceasedPercent', 0)
-            else:
-                infected_val = f"{county.get('infected', 0):,}"
-                deceased_val = f"{county.get('deceased', 0):,}"
-                infected_sort = county.get('infected', 0)
-                deceased_sort = county.get('deceased', 0)
-            
-            table_data.append({
-                'County': county_name,
-                'FIPS': fips,
-                'Infected': infected_val,
-                'Deceased': deceased_val,
-                'InfectedSort': infected_sort,
-                'DeceasedSort': deceased_sort
-            })
-        
-        df = pd.DataFrame(table_data)
+        counties = _county_frame(counties_data, self._fips_to_name)
+        infected_col, deceased_col, fmt = _view_columns(view_type)
         
-        # Apply sorting if specified
-        if sort_config and len(df) > 0:
+        # Apply sorting if specified, on the raw values before they are formatted
+        if sort_config and len(counties) > 0:
             sort_column = sort_config.get('category', 'County')
             sort_order = sort_config.get('order', 'asc')
             ascending = sort_order == 'asc'
             
             if sort_column == 'county':
-                df = df.sort_values('County', ascending=ascending)
+                counties = counties.sort_values('name', ascending=ascending)
             elif sort_column == 'infected':
-                df = df.sort_values('InfectedSort', ascending=ascending)
+                counties = counties.sort_values(infected_col, ascending=ascending)
             elif sort_column == 'deceased':
-                df = df.sort_values('DeceasedSort', ascending=ascending)
+                counties = counties.sort_values(deceased_col, ascending=ascending)
         
-        # Remove sort columns
-        df = df.drop(columns=['InfectedSort', 'DeceasedSort'], errors='ignore')
+        df = pd.DataFrame({
+            'County': counties['name'],
+            'FIPS': counties['fips'],
+            'Infected': fmt(counties[infected_col]),
+            'Deceased': fmt(counties[deceased_col])
+        })
         
         return df
     
-    def _create_empty_map(self) -> go.Figure:
+    def _fingerprint(self, data: Any) -> str:
+        """Cheap content hash of JSON-like input, used as a render cache key"""
+        payload = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+    
+    def _cached(self, key, build):
+        """Return the cached render for key, building and storing it on a miss"""
+        with self._render_cache_lock:
+            if key in self._render_cache:
+                self._render_cache.move_to_end(key)
+                return self._render_cache[key]
+        # Build outside the lock; concurrent misses on one key just build twice
+        result = build()
+        with self._render_cache_lock:
+            self._render_cache[key] = result
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        return result
+    
+    def _copy_figure(self, fig: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached figure dict deep enough that callers can restyle it safely"""
+        return {'data': [dict(trace) for trace in fig['data']], 'layout': dict(fig['layout'])}
+    
+    def _location_kwargs(self, fips_codes: List[str]) -> Dict[str, Any]:
+        """Get the choropleth location arguments for the available geometry"""
+        texas_geojson = self._get_texas_geojson()
+        if texas_geojson is not None:
+            return dict(geojson=texas_geojson, locations=fips_codes, locationmode='geojson-id')
+        # Fallback to state-level choropleth
+        return dict(locations=['TX'] * len(fips_codes), locationmode='USA-states')
+    
+    def _map_title(self, current_data: Dict, view_type: str) -> str:
+        """Get the choropleth title for a day and view type"""
+        return f"Day {current_data['day']} - Texas Counties ({'Percentage' if view_type == 'percent' else 'Count'} View)"
+    
+    def _get_texas_geojson(self) -> Optional[Dict[str, Any]]:
+        """Load the Texas GeoJSON once; None if it is unavailable"""
+        if not self._texas_geojson_loaded:
+            self._texas_geojson_loaded = True
+            try:
+                self._texas_geojson = self.data_loader.load_texas_outline()
+            except Exception as e:
+                logger.warning(f"Could not load Texas GeoJSON: {e}")
+        return self._texas_geojson
+    
+    def _create_empty_map(self) -> Dict[str, Any]:
         """Create empty map figure"""
-        fig = go.Figure()
-        fig.update_layout(
-            title="Texas Counties - No Data Available",
-            geo=dict(
-                scope='usa',
-                projection=go.layout.geo.Projection(type='albers usa'),
-                showlakes=True,
-                lakecolor='rgb(255, 255, 255)',
-                center=dict(lat=31.0, lon=-99.0),
-                lonaxis_range=[-106.0, -93.0],
-                lataxis_range=[25.0, 37.0]
-            ),
-            height=400,
-            margin=dict(l=0, r=0, t=40, b=0)
-        )
-        return fig
+        return EMPTY_MAP_FIGURE
     
-    def _create_empty_line_chart(self) -> go.Figure:
+    def _create_empty_line_chart(self) -> Dict[str, Any]:
         """Create empty line chart figure"""
-        fig = go.Figure()
-        fig.update_layout(
-            title="Epidemic Curve - No Data Available",
-            xaxis_title="Day",
-            yaxis_title="Population Count",
-            height=300,
-            margin=dict(l=40, r=40, t=60, b=40)
-        )
-        return fig
\ No newline at end of file
+        return EMPTY_LINE_CHART_FIGURE